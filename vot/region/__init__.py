@@ -25,7 +25,8 @@ class RegionType(Enum):
 
 class Region(ABC):
     """
-    Base class for all region containers
+    Base class for all region containers. Regions are not modified after construction,
+    use copy to obtain an independent object that can be modified.
 
     :var type: type of the region
     """
@@ -45,7 +46,7 @@ class Region(ABC):
     @abstractmethod
     def convert(self, rtype: RegionType):
         """Convert region to another type. Note that some conversions
-        degrade information.
+        degrade information. Converting to the same type returns the region itself.
         Arguments:
             rtype {RegionType} -- Desired type.
         """
@@ -87,7 +88,7 @@ class Special(Region):
 
     def convert(self, rtype: RegionType):
         if rtype == RegionType.SPECIAL:
-            return self.copy()
+            return self
         else:
             raise ConversionException("Unable to convert special region to {}".format(rtype))
 
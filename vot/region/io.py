@@ -6,67 +6,53 @@ import io
 import numpy as np
 from numba import jit
 
-@jit(nopython=True)
-def mask_to_rle(m):
+def mask_to_rle(m, order='C'):
     """
-    # Input: 2-D numpy array
+    # Input: 2-D numpy array, order in which pixels are visited ('C' row-major, 'F' column-major)
     # Output: list of numbers (1st number = #0s, 2nd number = #1s, 3rd number = #0s, ...)
+    # Note: region strings are always encoded row-major, column-major runs are only for other consumers (e.g. COCO)
     """
     # reshape mask to vector
-    v = m.reshape((m.shape[0] * m.shape[1]))
+    v = m.ravel(order=order)
 
     if v.size == 0:
         return [0]
 
-    # output is empty at the beginning
-    rle = []
-    # index of the last different element
-    last_idx = 0
+    # indices where two consecutive elements differ mark the starts of new runs
+    starts = np.flatnonzero(v[1:] != v[:-1]) + 1
+    rle = np.diff(np.concatenate(([0], starts, [v.size])))
+
     # check if first element is 1, so first element in RLE (number of zeros) must be set to 0
     if v[0] > 0:
-        rle.append(0)
-
-    # go over all elements and check if two consecutive are the same
-    for i in range(1, v.size):
-        if v[i] != v[i - 1]:
-            rle.append(i - last_idx)
-            last_idx = i
-
-    if v.size > 0:
-        # handle last element of rle
-        if last_idx < v.size - 1:
-            # last element is the same as one element before it - add number of these last elements
-            rle.append(v.size - last_idx)
-        else:
-            # last element is different than one element before - add 1
-            rle.append(1)
+        return [0] + rle.tolist()
 
-    return rle
+    return rle.tolist()
 
 @jit(nopython=True)
-def rle_to_mask(rle, width, height):
+def rle_to_mask(rle, width, height, order='C'):
     """
     rle: input rle mask encoding
     each evenly-indexed element represents number of consecutive 0s
     each oddly indexed element represents number of consecutive 1s
     width and height are dimensions of the mask
+    order: 'C' if runs are row-major, 'F' if they are column-major
     output: 2-D binary mask
     """
-    # allocate list of zeros
-    v = [0] * (width * height)
+    # allocate the output vector of zeros once, with its final size and type
+    v = np.zeros(width * height, dtype=np.uint8)
 
     # set id of the last different element to the beginning of the vector
     idx_ = 0
     for i in range(len(rle)):
         if i % 2 != 0:
             # write as many 1s as RLE says (zeros are already in the vector)
-            for j in range(rle[i]):
-                v[idx_+j] = 1
+            v[idx_:idx_ + rle[i]] = 1
         idx_ += rle[i]
 
     # reshape vector into 2-D mask
-    # return np.reshape(np.array(v, dtype=np.uint8), (height, width)) # numba bug / not supporting np.reshape
-    return np.array(v, dtype=np.uint8).reshape((height, width))
+    if order == 'F':
+        return np.ascontiguousarray(v.reshape((width, height)).T)
+    return v.reshape((height, width))
 
 def create_mask_from_string(mask_encoding):
     """
@@ -51,7 +51,7 @@ def rasterize_rectangle(data: np.ndarray, bounds: Tuple[int, int, int, int]):
 
 
 #@numba.njit(numba.uint8[:, ::1](numba.float32[:, ::1], numba.types.UniTuple(numba.int64, 4)))
-@numba.njit()
+@numba.njit(cache=True)
 def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
 
     #int nodes, pixelY, i, j, swap;
@@ -119,14 +119,13 @@ def rasterize_polygon(data: np.ndarray, bounds: Tuple[int, int, int, int]):
                     nodeX[i] = 0
                 if nodeX[i + 1] >= width:
                     nodeX[i + 1] = width - 1
-                for j in range(nodeX[i], nodeX[i + 1] + 1):
-                    mask[pixelY, j] = 1
+                mask[pixelY, nodeX[i]:nodeX[i + 1] + 1] = 1
             i += 2
 
     return mask
 
 
-@numba.njit()
+@numba.njit(cache=True)
 def copy_mask(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int, int, int]):
     tx = max(offset[0], bounds[0])
     ty = max(offset[1], bounds[1])
@@ -139,11 +138,17 @@ def copy_mask(mask: np.ndarray, offset: Tuple[int, int], bounds: Tuple[int, int,
     tw = min(bounds[2] + 1, offset[0] + mask.shape[1]) - tx
     th = min(bounds[3] + 1, offset[1] + mask.shape[0]) - ty
 
-    copy = np.zeros((bounds[3] - bounds[1] + 1, bounds[2] - bounds[0] + 1), dtype=np.uint8)
+    width = bounds[2] - bounds[0] + 1
+    height = bounds[3] - bounds[1] + 1
+
+    if ox == 0 and oy == 0 and tw == width and th == height:
+        # mask covers the entire output, there is no padding to fill with zeros
+        copy = np.empty((height, width), dtype=np.uint8)
+    else:
+        copy = np.zeros((height, width), dtype=np.uint8)
 
-    for i in range(th):
-        for j in range(tw):
-            copy[i + oy, j + ox] = mask[i + gy, j + gx]
+    if tw > 0 and th > 0:
+        copy[oy:oy + th, ox:ox + tw] = mask[gy:gy + th, gx:gx + tw]
 
     return copy
 
@@ -243,7 +248,7 @@ def calculate_overlap(reg1: Shape, reg2: Shape, bounds: Optional[Tuple[int, int]
         offset1 = (0, 0)
         type1 = _TYPE_RECTANGLE
     elif isinstance(reg1, Polygon):
-        data1 = np.round(reg1._points)
+        data1 = reg1._points
         offset1 = (0, 0)
         type1 = _TYPE_POLYGON
     elif isinstance(reg1, Mask):
@@ -256,7 +261,7 @@ def calculate_overlap(reg1: Shape, reg2: Shape, bounds: Optional[Tuple[int, int]
         offset2 = (0, 0)
         type2 = _TYPE_RECTANGLE
     elif isinstance(reg2, Polygon):
-        data2 = np.round(reg2._points)
+        data2 = reg2._points
         offset2 = (0, 0)
         type2 = _TYPE_POLYGON
     elif isinstance(reg2, Mask):
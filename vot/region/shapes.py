@@ -1,7 +1,5 @@
 import sys
 
-from copy import copy
-from functools import reduce
 from typing import Tuple, List
 from abc import ABC, abstractmethod
 
@@ -53,6 +51,7 @@ class Rectangle(Shape):
         """
         super().__init__()
         self._data = np.array([[x], [y], [width], [height]], dtype=np.float32)
+        self._int_box_cache = None
 
     def __str__(self):
         """ Create string from class """
@@ -78,21 +77,26 @@ class Rectangle(Shape):
     def type(self):
         return RegionType.RECTANGLE
 
+    @property
+    def _int_box(self):
+        """Rounded (x, y, width, height), computed once since rectangle is not modified after construction"""
+        if self._int_box_cache is None:
+            self._int_box_cache = (int(round(self.x)), int(round(self.y)), int(round(self.width)), int(round(self.height)))
+        return self._int_box_cache
+
     def copy(self):
-        return copy(self)
+        return Rectangle(self.x, self.y, self.width, self.height)
 
     def convert(self, rtype: RegionType):
         if rtype == RegionType.RECTANGLE:
-            return self.copy()
+            return self
         elif rtype == RegionType.POLYGON:
-            points = []
-            points.append((self.x, self.y))
-            points.append((self.x + self.width - 1, self.y))
-            points.append((self.x + self.width - 1, self.y + self.height - 1))
-            points.append((self.x, self.y + self.height - 1))
-            return Polygon(points)
+            left, top = self.x, self.y
+            right, bottom = left + self.width - 1, top + self.height - 1
+            return Polygon(np.array([[left, top], [right, top], [right, bottom], [left, bottom]], dtype=np.float32))
         elif rtype == RegionType.MASK:
-            return Mask(np.ones((int(round(self.height)), int(round(self.width))), np.uint8), (int(round(self.x)), int(round(self.y))))
+            x, y, width, height = self._int_box
+            return Mask(np.ones((height, width), np.uint8), (x, y), _trusted=True)
         else:
             raise ConversionException("Unable to convert rectangle region to {}".format(rtype), source=self)
 
@@ -136,17 +140,20 @@ class Polygon(Shape):
         """
         Constructor
 
-        :param list points: List of points as tuples [(x1,y1), (x2,y2),...,(xN,yN)]
+        :param list points: List of points as tuples [(x1,y1), (x2,y2),...,(xN,yN)] or an (N, 2) array
         """
         super().__init__()
-        assert(points)
-        self._points = np.array(points, dtype=np.float32)
+        if isinstance(points, np.ndarray):
+            self._points = points.astype(np.float32, copy=False)
+        else:
+            assert(points)
+            self._points = np.array(points, dtype=np.float32)
         assert(self._points.shape[0] >= 3 and self._points.shape[1] == 2)  # pylint: disable=E1136
 
 
     def __str__(self):
         """ Create string from class """
-        return ','.join(['{},{}'.format(p[0], p[1]) for p in self._points])
+        return ','.join(map(str, self._points.ravel().tolist()))
 
     @property
     def type(self):
@@ -163,39 +170,51 @@ class Polygon(Shape):
         return [self[i] for i in range(self.size)]
 
     def copy(self):
-        return copy(self)
+        return Polygon(self._points.copy())
 
     def convert(self, rtype: RegionType):
         if rtype == RegionType.POLYGON:
-            return self.copy()
+            return self
         elif rtype == RegionType.RECTANGLE:
-            top = np.min(self._points[:, 1])
-            bottom = np.max(self._points[:, 1])
-            left = np.min(self._points[:, 0])
-            right = np.max(self._points[:, 0])
+            left, top = self._points.min(axis=0)
+            right, bottom = self._points.max(axis=0)
 
             return Rectangle(left, top, right - left, bottom - top)
         elif rtype == RegionType.MASK:
             bounds = self.bounds()
-            mask = self.rasterize(bounds)
-            return Mask(mask, offset=(bounds[0], bounds[1]))
+            if self._is_axis_aligned_quad():
+                # the polygon fills its whole bounding box, no need to rasterize it
+                mask = np.ones((bounds[3] - bounds[1] + 1, bounds[2] - bounds[0] + 1), dtype=np.uint8)
+            else:
+                mask = self.rasterize(bounds)
+            return Mask(mask, offset=(bounds[0], bounds[1]), _trusted=True)
         else:
             raise ConversionException("Unable to convert polygon region to {}".format(rtype), source=self)
 
+    def _is_axis_aligned_quad(self):
+        """Checks if the polygon, with points rounded to pixels as during rasterization, is an axis-aligned rectangle"""
+        if self.size != 4:
+            return False
+        points = np.round(self._points)
+        edges = points - np.roll(points, 1, axis=0)
+        if not np.all((edges[:, 0] == 0) | (edges[:, 1] == 0)):
+            return False
+        if len(np.unique(points, axis=0)) != 4:
+            return False
+        return len(np.unique(points[:, 0])) == 2 and len(np.unique(points[:, 1])) == 2
+
     def draw(self, handle: DrawHandle):
         handle.polygon([(p[0], p[1]) for p in self._points])
 
     def resize(self, factor=1):
-        return Polygon([(p[0] * factor, p[1] * factor) for p in self._points])
+        return Polygon(self._points * factor)
 
     def move(self, dx=0, dy=0):
-        return Polygon([(p[0] + dx, p[1] + dy) for p in self._points])
+        return Polygon(self._points + np.array([dx, dy], dtype=np.float32))
 
     def is_empty(self):
-        top = np.min(self._points[:, 1])
-        bottom = np.max(self._points[:, 1])
-        left = np.min(self._points[:, 0])
-        right = np.max(self._points[:, 0])
+        left, top = self._points.min(axis=0)
+        right, bottom = self._points.max(axis=0)
         return top == bottom or left == right
 
     def rasterize(self, bounds: Tuple[int, int, int, int]):
@@ -203,10 +222,8 @@ class Polygon(Shape):
         return rasterize_polygon(self._points, bounds)
 
     def bounds(self):
-        top = np.min(self._points[:, 1])
-        bottom = np.max(self._points[:, 1])
-        left = np.min(self._points[:, 0])
-        right = np.max(self._points[:, 0])
+        left, top = self._points.min(axis=0)
+        right, bottom = self._points.max(axis=0)
         return int(round(left)), int(round(top)), int(round(right)), int(round(bottom))
 
 from vot.region.raster import mask_bounds
@@ -216,28 +233,45 @@ class Mask(Shape):
     """Mask region
     """
 
-    def __init__(self, mask: np.array, offset: Tuple[int, int] = (0, 0), optimize=False):
+    def __init__(self, mask: np.array, offset: Tuple[int, int] = (0, 0), optimize=False, _trusted=False):
         super().__init__()
-        self._mask = mask.astype(np.uint8)
-        self._mask[self._mask > 0] = 1
+        if _trusted and mask.dtype == np.uint8:
+            # internal callers pass masks that are already binary, no need to copy and threshold them
+            self._mask = mask
+        else:
+            self._mask = mask.astype(np.uint8)
+            self._mask[self._mask > 0] = 1
         self._offset = offset
         if optimize:  # optimize is used when mask without an offset is given (e.g. full-image mask)
             self._optimize()
 
     def __str__(self):
-        offset_str = '%d,%d' % self.offset
-        region_sz_str = '%d,%d' % (self.mask.shape[1], self.mask.shape[0])
-        rle_str = ','.join([str(el) for el in mask_to_rle(self.mask)])
-        return 'm%s,%s,%s' % (offset_str, region_sz_str, rle_str)
+        rle_str = ','.join(map(str, mask_to_rle(self.mask)))
+        return 'm%d,%d,%d,%d,%s' % (self.offset[0], self.offset[1], self.mask.shape[1], self.mask.shape[0], rle_str)
+
+    def _nonzero_bounds(self):
+        """Bounds (left, top, right, bottom) of positive pixels in mask coordinates, None if there are none"""
+        if self._mask.size == 0:
+            return None
+        x, y, w, h = cv2.boundingRect(self._mask)
+        if w == 0 or h == 0:
+            return None
+        return x, y, x + w - 1, y + h - 1
 
     def _optimize(self):
-        bounds = mask_bounds(self.mask)
-        if bounds[0] is None:
+        bounds = self._nonzero_bounds()
+        if bounds is None:
             # mask is empty
             self._mask = np.zeros((0, 0), dtype=np.uint8)
             self._offset = (0, 0)
         else:
-            self._mask = np.copy(self.mask[bounds[1]:bounds[3], bounds[0]:bounds[2]])
+            cropped = self._mask[bounds[1]:bounds[3] + 1, bounds[0]:bounds[2] + 1]
+            if cropped.flags.c_contiguous and cropped.size * 4 >= self._mask.size:
+                # crop covers most of the buffer and needs no compaction, keep it as a view
+                self._mask = cropped
+            else:
+                # copy small crops so that the large original buffer can be released
+                self._mask = np.copy(cropped)
             self._offset = (bounds[0] + self.offset[0], bounds[1] + self.offset[1])
 
     @property
@@ -253,18 +287,20 @@ class Mask(Shape):
         return RegionType.MASK
 
     def copy(self):
-        return copy(self)
+        return Mask(self._mask.copy(), self._offset, _trusted=True)
 
     def convert(self, rtype: RegionType):
         if rtype == RegionType.MASK:
-            return self.copy()
+            return self
         elif rtype == RegionType.RECTANGLE:
-            bounds = mask_bounds(self.mask)
+            bounds = self._nonzero_bounds()
+            if bounds is None:
+                return Rectangle(self.offset[0], self.offset[1], 0, 0)
             return Rectangle(bounds[0] + self.offset[0], bounds[1] + self.offset[1],
                             bounds[2] - bounds[0], bounds[3] - bounds[1])
         elif rtype == RegionType.POLYGON:
-            bounds = mask_bounds(self.mask)
-            if None in bounds:
+            bounds = self._nonzero_bounds()
+            if bounds is None:
                 return Polygon([(0, 0), (0, 0), (0, 0), (0, 0)])
             return Polygon([
                 (bounds[0] + self.offset[0], bounds[1] + self.offset[1]),
@@ -279,7 +315,7 @@ class Mask(Shape):
 
     def rasterize(self, bounds: Tuple[int, int, int, int]):
         from vot.region.raster import copy_mask
-        return copy_mask(self._mask, self._offset, np.array(bounds))
+        return copy_mask(self._mask, self._offset, tuple(bounds))
 
     def is_empty(self):
         if self.mask.shape[1] > 0 and self.mask.shape[0] > 0:
@@ -298,10 +334,10 @@ class Mask(Shape):
         else:
             mask = cv2.resize(self.mask, dsize=(width, height), interpolation=cv2.INTER_NEAREST)
 
-        return Mask(mask, offset, False)
+        return Mask(mask, offset, False, _trusted=True)
 
     def move(self, dx=0, dy=0):
-        return Mask(self._mask, (self.offset[0] + dx, self.offset[1] + dy))
+        return Mask(self._mask, (self.offset[0] + dx, self.offset[1] + dy), _trusted=True)
 
     def bounds(self):
         bounds = mask_bounds(self.mask)
@@ -24,3 +24,32 @@ class TestRasterMethods(unittest.TestCase):
         r1 = Rectangle(0, 0, 100, 100)
         self.assertEqual(calculate_overlap(r1, r1), 1)
 
+
+    def test_mask_optimize(self):
+        from vot.region import Mask
+
+        mask = np.zeros((10, 10), dtype=np.uint8)
+        mask[2:5, 3:7] = 1
+        region = Mask(mask, optimize=True)
+        self.assertEqual(region.offset, (3, 2))
+        np.testing.assert_array_equal(region.mask, np.ones((3, 4), dtype=np.uint8))
+
+    def test_rle_order(self):
+        from vot.region.io import mask_to_rle, rle_to_mask
+
+        mask = np.zeros((5, 7), dtype=np.uint8)
+        mask[1:4, 2:6] = 1
+        for order in ['C', 'F']:
+            rle = np.array(mask_to_rle(mask, order=order), dtype=np.int32)
+            np.testing.assert_array_equal(rle_to_mask(rle, 7, 5, order=order), mask)
+
+    def test_polygon_to_mask(self):
+        from vot.region import Polygon, RegionType
+
+        for points in [[(0, 0), (10, 0), (10, 10), (0, 10)], [(10, 0), (0, 0), (0, 10), (10, 10)],
+                [(0, 0), (10, 0), (0.3, 0.2), (0, 10)], [(0, 0), (10, 0), (0, 0), (0, 10)]]:
+            polygon = Polygon(points)
+            bounds = polygon.bounds()
+            mask = polygon.convert(RegionType.MASK)
+            self.assertEqual(mask.offset, (bounds[0], bounds[1]))
+            np.testing.assert_array_equal(mask.mask, rasterize_polygon(polygon._points, bounds))